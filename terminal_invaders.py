@@ -5,24 +5,41 @@ Raises an exception if attempting to display out of bounds.
 Minimum terminal size: 3 (width) x 4 (height).
 This size allows for a "center" and a gap between player and enemies,
 along with a status bar at the top.
+The status bar shows debug values and is only drawn when TI_DEBUG is set.
 
 Enemies are dynamically spaced across the center third of the screen.
 
+Movement is frame rate independent: speeds are in cells per second and
+each frame accumulates speed * dt until a whole step can be taken.
+
 Data structures:
-enemies = [{'y': int, 'x': int, 'alive': bool}]
-projectiles = [{'y': int, 'x': int, 'last_move_time': time.time()}]
+enemies = Enemies(y=array, x=array, alive=array, ...)  # one array per field
+projectiles = [Projectile(y=int, x=int, speed=float, progress=float)]
+frame = {(y, x): (char, attr)}
 """
 
-from typing import Callable, List, Tuple, TypedDict
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, TypedDict
 from enum import StrEnum
 
 import curses
 import time
 import logging
+import os
 import sys
-import subprocess
 import traceback
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
 
 class GAME_STATE(StrEnum):
     PLAY = "play"
@@ -30,27 +47,74 @@ class GAME_STATE(StrEnum):
     WIN = "win"
 
 
-class Enemy(TypedDict):
+@dataclass(slots=True)
+class Enemies:
+    # Typed arrays rather than lists so the kernels can be JIT compiled
+    y: array
+    x: array
+    alive: array  # Indices of living enemies
+    # Edges of the living block, kept up to date as it moves
+    left_most: int
+    right_most: int
+    bottom_most: int
+    # Living enemy index by starting (y, x). The block only ever moves as a
+    # whole, so subtracting how far it has moved finds any enemy's key
+    by_coord: Dict[Tuple[int, int], int]
+    moved_y: int = 0
+    moved_x: int = 0
+
+
+@dataclass(slots=True)
+class Projectile:
     y: int
     x: int
-    alive: bool
+    speed: float  # Cells per second
+    progress: float = 0.0  # Fraction of a cell travelled towards the next step
 
 
-class Projectile(TypedDict):
-    y: int
-    x: int
-    speed: float
-    last_move_time: float
+Cell = Tuple[str, int]
+Frame = Dict[Tuple[int, int], Cell]
+BLANK_CELL: Cell = (" ", curses.A_NORMAL)
+
+
+class Sprites(TypedDict):
+    enemy: Cell
+    player: Cell
+    projectile: Cell
 
 
 PLAYER_SHIP: str = "☺"
 ENEMY_SHIP: str = "V"
 PROJECTILE_CHR: str = "|"
-INITIAL_ENEMY_SPEED: float = 0.5  # Seconds
-MAX_ENEMY_SPEED: float = 0.05  # Seconds
-INITIAL_PROJECTILE_SPEED: float = 0.1  # Seconds
+INITIAL_ENEMY_SPEED: float = 2.0  # Cells per second
+MAX_ENEMY_SPEED: float = 20.0  # Cells per second
+INITIAL_PROJECTILE_SPEED: float = 10.0  # Cells per second
+FRAME_TIME: float = 1 / 60  # Seconds
+MAX_FRAME_DT: float = 0.1  # Seconds, stops sprites skipping cells after a stall
 LEFT_EDGE: int = 0
 RIGHT_EDGE_OFFSET: int = 2
+# DEC private mode 2026: terminal buffers output until the frame is complete
+BEGIN_SYNC_OUTPUT: str = "\x1b[?2026h"
+END_SYNC_OUTPUT: str = "\x1b[?2026l"
+SYNC_OUTPUT_TERMS: Tuple[str, ...] = ("xterm", "tmux", "wezterm", "kitty")
+DEBUG: bool = bool(os.environ.get("TI_DEBUG"))  # Show the status bar
+# Status bar layouts by minimum terminal width, the widest that fits is used
+STATUS_FORMATS: Tuple[Tuple[int, str], ...] = (
+    (
+        100,
+        "width={width} - height={height}, "
+        "enemy_speed={enemy_speed:.2f}, "
+        "enemy_direction={enemy_direction}, "
+        "edges={left_most}-{right_most}, "
+        "time_since_last_move={time_since_last_move:.1f}",
+    ),
+    (
+        40,
+        "speed={enemy_speed:.2f} dir={enemy_direction:+d} "
+        "edges={left_most}-{right_most}",
+    ),
+    (0, "{enemy_direction:+d} {enemy_speed:.1f}"),
+)
 
 
 # Decorator to display exceptions while using curses
@@ -63,14 +127,12 @@ def curses_safe_run(func: Callable[..., None]):
             func(*args, **kwargs)
         except curses.error as e:
             curses.endwin()
-            subprocess.run(["reset"])
             logging.error(f"Curses Error: {e}")
             traceback.print_exc()
             input("Press Enter to continue...")
             sys.exit(1)  # Remove to allow recovery
         except Exception as e:
             curses.endwin()
-            subprocess.run(["reset"])
             logging.error(f"Unhandled Exception: {type(e).__name__}: {e}")
             traceback.print_exc()
             input("Press Enter to continue...")
@@ -79,109 +141,212 @@ def curses_safe_run(func: Callable[..., None]):
     return wrapper
 
 
+def supports_sync_output() -> bool:
+    term = os.environ.get("TERM", "")
+    return any(name in term for name in SYNC_OUTPUT_TERMS)
+
+
 class TerminalSizeError(Exception):
     """Raised when the terminal size is too small to play the game."""
 
     pass
 
 
+@njit(cache=True)
+def shift_enemies(column: array, alive: array, step: int) -> None:
+    for i in alive:
+        column[i] += step
+
+
+@njit(cache=True)
+def find_enemy_edges(
+    enemy_y: array, enemy_x: array, alive: array
+) -> Tuple[int, int, int]:
+    left_most = right_most = enemy_x[alive[0]]
+    bottom_most = enemy_y[alive[0]]
+    for i in alive:
+        x = enemy_x[i]
+        if x < left_most:
+            left_most = x
+        elif x > right_most:
+            right_most = x
+        if enemy_y[i] > bottom_most:
+            bottom_most = enemy_y[i]
+
+    return left_most, right_most, bottom_most
+
+
+def update_enemy_edges(enemies: Enemies) -> None:
+    # Full rescan, only needed when an enemy on the edge of the block dies
+    if not enemies.alive:
+        return
+
+    enemies.left_most, enemies.right_most, enemies.bottom_most = find_enemy_edges(
+        enemies.y, enemies.x, enemies.alive
+    )
+
+
 def move_enemies(
-    alive_enemies: List[Enemy],
+    enemies: Enemies,
     enemy_direction: int,
     width: int,
     move_down: bool,
 ) -> Tuple[int, int, bool]:
-    left_most = width
-    right_most = 0
-    bottom_most = 0
-
-    for enemy in alive_enemies:
-        if move_down:
-            enemy["y"] += 1
-        else:
-            enemy["x"] += enemy_direction
-        bottom_most = max(bottom_most, enemy["y"])
-        left_most = min(left_most, enemy["x"])
-        right_most = max(right_most, enemy["x"])
+    enemy_y = enemies.y
+    enemy_x = enemies.x
+
+    # The whole block moves together, so its edges shift by the same step
+    if move_down:
+        shift_enemies(enemy_y, enemies.alive, 1)
+        enemies.bottom_most += 1
+        enemies.moved_y += 1
+    else:
+        shift_enemies(enemy_x, enemies.alive, enemy_direction)
+        enemies.left_most += enemy_direction
+        enemies.right_most += enemy_direction
+        enemies.moved_x += enemy_direction
 
     # Flip direction of travel if edge of screen reached by leftmost or rightmost enemy.
-    if left_most == LEFT_EDGE or right_most == width - 1:
+    if enemies.left_most == LEFT_EDGE or enemies.right_most == width - 1:
         if move_down:
             enemy_direction *= -1
             move_down = False
         else:
             move_down = True
 
-    return bottom_most, enemy_direction, move_down
+    return enemies.bottom_most, enemy_direction, move_down
 
 
-def update_enemy_speed(alive_enemies: List[Enemy], total_enemy_count: int) -> float:
-    destroyed_enemy_count = total_enemy_count - len(alive_enemies)
+def update_enemy_speed(alive_count: int, total_enemy_count: int) -> float:
+    destroyed_enemy_count = total_enemy_count - alive_count
     destruction_ratio = destroyed_enemy_count / total_enemy_count
     # Quadratic scaling, remove square for linear scaling
     speed_factor = destruction_ratio**2
-    enemy_speed = (
-        INITIAL_ENEMY_SPEED - (INITIAL_ENEMY_SPEED - MAX_ENEMY_SPEED) * speed_factor
-    )
+    # Ease the time between moves, then convert it to a speed
+    initial_interval = 1 / INITIAL_ENEMY_SPEED
+    min_interval = 1 / MAX_ENEMY_SPEED
+    move_interval = initial_interval - (initial_interval - min_interval) * speed_factor
 
-    return max(MAX_ENEMY_SPEED, enemy_speed)
+    return min(MAX_ENEMY_SPEED, 1 / move_interval)
 
 
 def move_projectiles(
     projectiles: List[Projectile],
-    curr_time: float,
-    total_enemy_count: int,
-    enemies: List[Enemy],
+    dt: float,
+    enemy_speed_table: List[float],
+    enemies: Enemies,
     enemy_speed: float,
-) -> tuple[GAME_STATE, float]:
+) -> tuple[GAME_STATE, float, bool]:
+    # Most frames have nothing in flight, skip building an empty survivor list
+    if not projectiles:
+        return GAME_STATE.PLAY, enemy_speed, False
+
+    enemy_x = enemies.x
+    enemy_alive = enemies.alive
+    by_coord = enemies.by_coord
     game_state = GAME_STATE.PLAY
-    for projectile in projectiles[:]:
-        if curr_time - projectile["last_move_time"] >= projectile["speed"]:
-            if projectile["y"] < 1:
-                projectiles.remove(projectile)
-            else:
-                for enemy in enemies:
-                    if (
-                        enemy["alive"]
-                        and enemy["y"] == projectile["y"]
-                        and enemy["x"] == projectile["x"]
-                    ):
-                        projectiles.remove(projectile)
-                        enemy["alive"] = False
-                        alive_enemies = [enemy for enemy in enemies if enemy["alive"]]
-                        if len(alive_enemies) == 0:
-                            game_state = GAME_STATE.WIN
-                        enemy_speed = update_enemy_speed(
-                            alive_enemies, total_enemy_count
-                        )
-                        break
-
-            # Move projectile after collision check
-            projectile["y"] -= 1
-            projectile["last_move_time"] = curr_time
-
-    return game_state, enemy_speed
-
-
-def render(
-    stdscr: curses.window,
-    enemies: List[Enemy],
-    player_pos: List[int],
-    projectiles: List[Projectile],
-) -> None:
-    # Render enemies
-    for enemy in enemies:
-        if enemy["alive"]:
-            stdscr.addch(enemy["y"], enemy["x"], ENEMY_SHIP, curses.color_pair(1))
+    moved = False  # Whether anything on screen changed
+    # Projectiles still in flight, collected in the same pass that moves them
+    survivors: List[Projectile] = []
+    for projectile in projectiles:
+        projectile.progress += dt * projectile.speed
+        # An enemy may have stepped into the projectile since it last moved,
+        # so check the cell it is in before the cell it moves into
+        j = by_coord.pop(
+            (projectile.y - enemies.moved_y, projectile.x - enemies.moved_x), None
+        )
+        if j is None and projectile.progress >= 1:
+            projectile.y -= 1
+            projectile.progress -= 1
+            moved = True
+            if projectile.y < 1:
+                # Reached the status bar
+                continue
+
+            j = by_coord.pop(
+                (projectile.y - enemies.moved_y, projectile.x - enemies.moved_x), None
+            )
+        if j is None:
+            survivors.append(projectile)
+        else:
+            moved = True
+            enemy_alive.remove(j)
+            # The block is a single row, so only the side edges can change
+            if enemy_x[j] == enemies.left_most or enemy_x[j] == enemies.right_most:
+                update_enemy_edges(enemies)
+            if not enemy_alive:
+                game_state = GAME_STATE.WIN
+            enemy_speed = enemy_speed_table[len(enemy_alive)]
+
+    if len(survivors) != len(projectiles):
+        projectiles[:] = survivors
 
-    # Render player
-    stdscr.addch(player_pos[0], player_pos[1], PLAYER_SHIP)
+    return game_state, enemy_speed, moved
 
-    # Render projectiles
+
+def build_frame(
+    enemies: Enemies,
+    player_pos: List[int],
+    projectiles: List[Projectile],
+    status_cells: Frame,
+    sprites: Sprites,
+) -> Frame:
+    frame: Frame = {}
+
+    # Enemies
+    enemy_cell = sprites["enemy"]
+    enemy_y = enemies.y
+    enemy_x = enemies.x
+    for i in enemies.alive:
+        frame[(enemy_y[i], enemy_x[i])] = enemy_cell
+
+    # Player
+    frame[(player_pos[0], player_pos[1])] = sprites["player"]
+
+    # Projectiles
+    projectile_cell = sprites["projectile"]
     for projectile in projectiles:
-        stdscr.addch(
-            projectile["y"], projectile["x"], PROJECTILE_CHR, curses.color_pair(2)
-        )
+        frame[(projectile.y, projectile.x)] = projectile_cell
+
+    # Status bar is drawn last so it stays on top
+    frame.update(status_cells)
+
+    return frame
+
+
+def render(window: curses.window, prev_frame: Frame, frame: Frame) -> None:
+    # Group the cells that changed since last frame by row,
+    # blanking cells that were drawn last frame but are now empty
+    rows: Dict[int, List[Tuple[int, Cell]]] = {}
+    row = rows.setdefault
+    prev_cell = prev_frame.get
+    for y, x in prev_frame.keys() - frame.keys():
+        row(y, []).append((x, BLANK_CELL))
+    for (y, x), cell in frame.items():
+        if prev_cell((y, x)) != cell:
+            row(y, []).append((x, cell))
+
+    # Write each contiguous run of same colored cells with a single addstr.
+    # Every color pair has a black background, so blanks can join any run.
+    addstr = window.addstr
+    for y, cells in rows.items():
+        cells.sort()
+        run_x, (char, run_attr) = cells[0]
+        run_chars = [char]
+        run_blank = char == " "
+        for x, (char, attr) in cells[1:]:
+            if x == run_x + len(run_chars) and (
+                attr == run_attr or char == " " or run_blank
+            ):
+                run_chars.append(char)
+                if run_blank and char != " ":
+                    run_attr = attr
+                    run_blank = False
+            else:
+                addstr(y, run_x, "".join(run_chars), run_attr)
+                run_x, run_attr, run_chars = x, attr, [char]
+                run_blank = char == " "
+        addstr(y, run_x, "".join(run_chars), run_attr)
 
 
 @curses_safe_run
@@ -193,109 +358,245 @@ def main(stdscr: curses.window):
             "Your terminal must be at least 3 (width) x 4 (height) to play this game."
         )
     third_of_screen: int = width // 3
+    # End of game banners, centered: (y, x, text)
+    game_over_banner: Tuple[int, int, str] = (
+        height // 2,
+        width // 2 - min(width // 2, 4),
+        "game over"[:width],
+    )
+    win_banner: Tuple[int, int, str] = (
+        height // 2,
+        width // 2 - min(width // 2, 3),
+        "you win"[:width],
+    )
+
+    # Everything is drawn on a pad covering the terminal. Input is read from
+    # the pad too, as reading from stdscr would refresh it over the playfield.
+    pad = curses.newpad(height, width)
+    pad.keypad(True)
 
     # Initial settings
     curses.curs_set(0)  # Hides cursor
-    stdscr.nodelay(True)  # Don't wait for input
+    # The cursor is hidden, so let it stay wherever the last write left it
+    # rather than moving it back to the window cursor after every refresh
+    pad.leaveok(True)
+    pad.nodelay(True)  # Don't wait for input
+    # Don't cut a refresh short to check for pending input, so each frame
+    # goes out in full in one write instead of being split across refreshes
+    curses.typeahead(-1)
 
     player_pos: List[int] = [height - 1, width // 2]  # bottom center
 
     projectiles: List[Projectile] = []
     fire_cooldown: float = 0.5  # Seconds
-    last_fire_time: float = time.time()
+    last_fire_time: float = time.monotonic()
 
     enemy_direction: int = 1  # Start right
-    enemy_speed: float = INITIAL_ENEMY_SPEED  # Seconds per movement.
+    enemy_speed: float = INITIAL_ENEMY_SPEED  # Cells per second
+    enemy_move_progress: float = 0.0  # Fraction of a cell towards the next step
     # Dynamically size enemies to occupy third of screen
-    enemies: List[Enemy] = [
-        {"y": 1, "x": num, "alive": True}
-        for num in range(third_of_screen + 1, third_of_screen * 2 + 1, 2)
+    enemy_columns = range(third_of_screen + 1, third_of_screen * 2 + 1, 2)
+    enemies = Enemies(
+        y=array("h", [1] * len(enemy_columns)),
+        x=array("h", enemy_columns),
+        alive=array("i", range(len(enemy_columns))),
+        left_most=enemy_columns[0],
+        right_most=enemy_columns[-1],
+        bottom_most=1,
+        by_coord={(1, x): i for i, x in enumerate(enemy_columns)},
+    )
+    # With Numba these calls compile the kernels up front, otherwise the
+    # first enemy move would stall the game while they compile
+    update_enemy_edges(enemies)
+    shift_enemies(enemies.x, enemies.alive, 0)
+    total_enemy_count: int = len(enemy_columns)
+    # Speed only depends on how many enemies are left, index by alive count
+    enemy_speed_table: List[float] = [
+        update_enemy_speed(alive_count, total_enemy_count)
+        for alive_count in range(total_enemy_count + 1)
     ]
-    alive_enemies: List[Enemy] = [enemy for enemy in enemies if enemy["alive"]]
-    total_enemy_count: int = len(enemies)
-    last_move_time: float = time.time()
+    last_move_time: float = time.monotonic()
     move_down = False
 
     curses.start_color()
     curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)  # Enemy ship
     curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # BEAM
     curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_BLACK)  # Player ship
+    # Color pairs never change, so look them up once rather than every frame
+    sprites: Sprites = {
+        "enemy": (ENEMY_SHIP, curses.color_pair(1)),
+        "player": (PLAYER_SHIP, curses.A_NORMAL),
+        "projectile": (PROJECTILE_CHR, curses.color_pair(2)),
+    }
 
     game_state: GAME_STATE = GAME_STATE.PLAY
+    # Last frame drawn to the screen, diffed against to only redraw changes
+    prev_frame: Frame = {}
+    sync_output: bool = supports_sync_output()
+    last_frame_time: float = time.monotonic()
+    # Status bar layout, chosen once for the terminal width
+    status_format: str = next(
+        layout for min_width, layout in STATUS_FORMATS if width >= min_width
+    )
+    # Reused between updates, width and height never change mid-game
+    status_values: Dict[str, float] = {"width": width, "height": height}
+    status_cells: Frame = {}
+    last_status_key: Tuple[float, int, int, int, int] | None = None
+    # Narrower layouts leave out the move timer, so it mustn't mark them dirty
+    shows_move_time: bool = "time_since_last_move" in status_format
+    # Set whenever something on screen changes, frames without changes
+    # skip rendering entirely
+    dirty: bool = True
+
+    # Key handlers, they update the game state above through the closure
+    def move_left() -> None:
+        nonlocal dirty
+        if player_pos[1] > LEFT_EDGE:
+            player_pos[1] -= 1
+            dirty = True
+
+    def move_right() -> None:
+        nonlocal dirty
+        if player_pos[1] < width - RIGHT_EDGE_OFFSET:
+            player_pos[1] += 1
+            dirty = True
+
+    def quit_game() -> None:
+        nonlocal game_state
+        game_state = GAME_STATE.LOSE
+
+    def fire() -> None:
+        nonlocal last_fire_time, dirty
+        if curr_time - last_fire_time >= fire_cooldown:
+            projectiles.append(
+                Projectile(player_pos[0] - 1, player_pos[1], INITIAL_PROJECTILE_SPEED)
+            )
+            last_fire_time = curr_time
+            dirty = True
+
+    def redraw() -> None:
+        # The terminal may have mangled the screen, forget what was drawn
+        # so the next frame repaints everything from scratch
+        nonlocal prev_frame, dirty
+        pad.clear()
+        prev_frame = {}
+        dirty = True
+
+    input_handlers: Dict[int, Callable[[], None]] = {
+        curses.KEY_LEFT: move_left,
+        curses.KEY_RIGHT: move_right,
+        ord("q"): quit_game,
+        ord(" "): fire,
+        curses.KEY_RESIZE: redraw,
+    }
+
+    # Bind methods called every frame to locals to skip attribute lookups
+    getch = pad.getch
+    timeout = pad.timeout
+    noutrefresh = pad.noutrefresh
+    doupdate = curses.doupdate
+    monotonic = time.monotonic
+    sleep = time.sleep
+    # Frames are due on a fixed schedule, independent of how long each took
+    next_frame_time: float = monotonic() + FRAME_TIME
 
     while game_state == GAME_STATE.PLAY:
-        stdscr.clear()
-        curr_time: float = time.time()
+        curr_time: float = monotonic()
+        dt: float = min(MAX_FRAME_DT, curr_time - last_frame_time)
+        last_frame_time = curr_time
 
         # Projectile movement
-        game_state, enemy_speed = move_projectiles(
-            projectiles, curr_time, total_enemy_count, enemies, enemy_speed
+        game_state, enemy_speed, projectiles_moved = move_projectiles(
+            projectiles, dt, enemy_speed_table, enemies, enemy_speed
         )
+        if projectiles_moved:
+            dirty = True
 
         # Enemy ship movement
         time_since_last_move: float = curr_time - last_move_time
-        if time_since_last_move > enemy_speed:
-            if alive_enemies:
-                bottom_edge, enemy_direction, move_down = move_enemies(
-                    alive_enemies, enemy_direction, width, move_down
-                )
-                last_move_time = curr_time
-                if bottom_edge >= height - 1:
-                    game_state = GAME_STATE.LOSE
-
-        # Handle user input
-        player_key = stdscr.getch()
-        if player_key == curses.KEY_LEFT and player_pos[1] > LEFT_EDGE:
-            player_pos[1] -= 1
-        elif (
-            player_key == curses.KEY_RIGHT and player_pos[1] < width - RIGHT_EDGE_OFFSET
-        ):
-            player_pos[1] += 1
-        elif player_key == ord("q"):
-            game_state = GAME_STATE.LOSE
-        elif player_key == ord(" "):
-            if curr_time - last_fire_time >= fire_cooldown:
-                projectiles.append(
-                    {
-                        "y": player_pos[0] - 1,
-                        "x": player_pos[1],
-                        "speed": INITIAL_PROJECTILE_SPEED,
-                        "last_move_time": time.time(),
-                    }
-                )
-                last_fire_time = curr_time
-
-        # Render ships
-        render(stdscr, enemies, player_pos, projectiles)
-
-        # Status bar
-        status: str = (
-            f"{width=} - {height=}, "
-            f"{enemy_speed=:.2f}, "
-            f"{enemy_direction=}, "
-            f"{time_since_last_move=:.2f}, "
-        )
-        stdscr.addstr(0, 0, status[:width])
-
-        if game_state == GAME_STATE.LOSE:
-            stdscr.addstr(
-                height // 2, width // 2 - min(width // 2, 4), "game over"[:width]
+        enemy_move_progress += dt * enemy_speed
+        while game_state == GAME_STATE.PLAY and enemy_move_progress >= 1:
+            enemy_move_progress -= 1
+            bottom_edge, enemy_direction, move_down = move_enemies(
+                enemies, enemy_direction, width, move_down
             )
-            stdscr.refresh()
-            time.sleep(2)
-        elif game_state == GAME_STATE.WIN:
-            stdscr.addstr(
-                height // 2,
-                width // 2 - min(width // 2, 3),
-                "you win"[:width],
+            last_move_time = curr_time
+            dirty = True
+            if bottom_edge >= height - 1:
+                game_state = GAME_STATE.LOSE
+
+        # Handle every key queued since the last frame, not just the first
+        while (player_key := getch()) != -1:
+            handler = input_handlers.get(player_key)
+            if handler:
+                handler()
+
+        # Status bar, only reformatted when a displayed value changes
+        if DEBUG:
+            status_key = (
+                enemy_speed,
+                enemy_direction,
+                int(time_since_last_move * 10) if shows_move_time else 0,
+                enemies.left_most,
+                enemies.right_most,
             )
-            stdscr.refresh()
-            time.sleep(2)
+            if status_key != last_status_key:
+                status_values["enemy_speed"] = enemy_speed
+                status_values["enemy_direction"] = enemy_direction
+                status_values["time_since_last_move"] = status_key[2] / 10
+                status_values["left_most"] = enemies.left_most
+                status_values["right_most"] = enemies.right_most
+                status = status_format.format_map(status_values)[:width]
+                status_cells = {
+                    (0, x): (char, curses.A_NORMAL) for x, char in enumerate(status)
+                }
+                last_status_key = status_key
+                dirty = True
+
+        if dirty or game_state != GAME_STATE.PLAY:
+            if sync_output:
+                sys.stdout.write(BEGIN_SYNC_OUTPUT)
+                sys.stdout.flush()
+
+            # Render only what changed since the last frame
+            frame = build_frame(enemies, player_pos, projectiles, status_cells, sprites)
+            render(pad, prev_frame, frame)
+            prev_frame = frame
+
+            if game_state == GAME_STATE.LOSE:
+                pad.addstr(*game_over_banner)
+            elif game_state == GAME_STATE.WIN:
+                pad.addstr(*win_banner)
+            # Stage the pad, then send the whole frame to the terminal at once
+            noutrefresh(0, 0, 0, 0, height - 1, width - 1)
+            doupdate()
+
+            if sync_output:
+                sys.stdout.write(END_SYNC_OUTPUT)
+                sys.stdout.flush()
+            dirty = False
+
+        if game_state != GAME_STATE.PLAY:
+            sleep(2)
         else:
-            stdscr.refresh()
-
-            # Game loop speed, keep it low for responsive player movement
-            time.sleep(0.05)
+            # Wait for the next frame inside curses rather than sleeping, so
+            # a key press ends the wait and gets its own frame straight away.
+            # A late wake up is made up by a shorter wait on the next frame.
+            delay = next_frame_time - monotonic()
+            if delay > 0:
+                timeout(int(delay * 1000))
+                player_key = getch()
+                timeout(0)
+                if player_key == -1:
+                    next_frame_time += FRAME_TIME
+                else:
+                    # Leave it for the next frame's input handling
+                    curses.ungetch(player_key)
+            else:
+                # Running behind, restart the schedule rather than rushing
+                # through a burst of frames to catch up
+                next_frame_time = monotonic() + FRAME_TIME
 
 
-curses.wrapper(main)
+if __name__ == "__main__":
+    curses.wrapper(main)